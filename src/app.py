@@ -5,21 +5,62 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
-from pydantic import BaseModel
-import os
+from pydantic import BaseModel, EmailStr
+import asyncio
+import gzip
+import sys
+import hashlib
+import orjson
 from pathlib import Path
-import re
 
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
 
-# Mount the static files directory
-current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
+
+def _json_response(content, status_code: int = 200) -> Response:
+    """Serialize with orjson and skip FastAPI's jsonable_encoder pass."""
+    return Response(content=orjson.dumps(content), status_code=status_code,
+                    media_type="application/json")
+
+
+@app.exception_handler(RequestValidationError)
+async def handle_validation_error(request: Request, exc: RequestValidationError):
+    """Keep the historical 400 "Invalid email format" contract for bad emails.
+
+    EmailStr validation happens before the handler runs and would otherwise
+    surface as a 422; other validation errors keep FastAPI's default response.
+    """
+    if any("email" in error.get("loc", ()) and error.get("type") != "missing"
+           for error in exc.errors()):
+        return _json_response({"detail": "Invalid email format"}, status_code=400)
+    return await request_validation_exception_handler(request, exc)
+
+# Mount the static files directory (path resolved once at import);
+# check_dir=False skips the existence stat on startup path resolution
+STATIC_DIR = str(Path(__file__).resolve().parent / "static")
+app.mount("/static", StaticFiles(directory=STATIC_DIR, html=True, check_dir=False),
+          name="static")
+
+
+# Landing page read once at import; serving the bytes directly avoids the
+# redirect round-trip and a file open per request
+with open(Path(STATIC_DIR) / "index.html", "rb") as _f:
+    _INDEX = _f.read()
+_INDEX_GZ = gzip.compress(_INDEX)
+_INDEX_ETAG = f'"{hashlib.blake2b(_INDEX, digest_size=8).hexdigest()}"'
+
+
+@app.middleware("http")
+async def add_static_cache_headers(request: Request, call_next):
+    """Let browsers cache static assets instead of re-requesting them."""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=3600, immutable"
+    return response
 
 # In-memory activity database
 activities = {
@@ -79,103 +120,129 @@ activities = {
     }
 }
 
+# Intern the fixed set of activity names so lookups against incoming path
+# parameters can short-circuit on pointer equality
+activities = {sys.intern(name): activity for name, activity in activities.items()}
+_ACTIVITY_NAMES = frozenset(activities)
+
+# Store participants as sets for O(1) membership checks and removal.
+# A plain set is sufficient at current max_participants caps (15-30); a Bloom
+# filter or fingerprint set only pays off at 10^4+ entries per activity.
+for _activity in activities.values():
+    _activity["participants"] = set(_activity["participants"])
+
+# Immutable per-activity fields (description, schedule, max_participants)
+# serialized once at import, minus the closing brace so the current
+# participants can be spliced in when the response body is rebuilt
+_META_BYTES = {
+    name: orjson.dumps({k: v for k, v in activity.items() if k != "participants"})[:-1]
+    for name, activity in activities.items()
+}
 
-def validate_email(email: str) -> bool:
-    """Validate email format"""
-    if not email or not email.strip():
-        return False
-    
-    # Check for @ symbol
-    if '@' not in email or email.count('@') != 1:
-        return False
-    
-    local_part, domain = email.split('@')
-    
-    # Validate local part (before @)
-    if not local_part:
-        return False
-    # No leading or trailing dots
-    if local_part.startswith('.') or local_part.endswith('.'):
-        return False
-    # No consecutive dots
-    if '..' in local_part:
-        return False
-    # Only allowed characters
-    if not re.match(r'^[a-zA-Z0-9._%+-]+$', local_part):
-        return False
-    
-    # Validate domain part (after @)
-    if not domain:
-        return False
-    # Must have at least one dot for TLD
-    if '.' not in domain:
-        return False
-    # No leading or trailing dots or hyphens
-    if domain.startswith('.') or domain.endswith('.') or domain.startswith('-') or domain.endswith('-'):
-        return False
-    # No consecutive dots
-    if '..' in domain:
-        return False
-    # Ensure no individual domain label starts or ends with a hyphen
-    labels = domain.split('.')
-    for label in labels:
-        if not label:
-            return False
-        if label.startswith('-') or label.endswith('-'):
-            return False
-    # Only allowed characters and must end with valid TLD
-    if not re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', domain):
+# Per-activity locks so concurrent signups can't interleave between the
+# capacity check and the mutation once handlers run on the event loop
+_LOCKS = {name: asyncio.Lock() for name in activities}
+
+# Cached /activities response body and ETag; rebuilt lazily after mutations
+_ACTIVITIES_CACHE = {"etag": None, "body": None}
+
+
+def _invalidate_activities_cache():
+    """Drop the cached /activities body after a signup or unregister."""
+    _ACTIVITIES_CACHE["etag"] = None
+    _ACTIVITIES_CACHE["body"] = None
+
+
+def _etag_matches(if_none_match, etag: str) -> bool:
+    """Check a quoted ETag against an If-None-Match header (RFC 7232)."""
+    if not if_none_match:
         return False
-    
-    return True
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag
+               for tag in if_none_match.split(","))
+
+
 class EmailRequest(BaseModel):
-    email: str
+    email: EmailStr
 
 
 @app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+async def root(request: Request) -> Response:
+    if _etag_matches(request.headers.get("if-none-match"), _INDEX_ETAG):
+        return Response(status_code=304, headers={"ETag": _INDEX_ETAG})
+    headers = {"ETag": _INDEX_ETAG, "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(_INDEX_GZ, media_type="text/html", headers=headers)
+    return Response(_INDEX, media_type="text/html", headers=headers)
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities(request: Request) -> Response:
+    if _ACTIVITIES_CACHE["body"] is None:
+        # Splice the frozen metadata bytes with the current participants
+        # (sorted for a stable response) so only the mutable slice is
+        # re-serialized on rebuild
+        body = b'{' + b','.join(
+            orjson.dumps(name) + b':' + _META_BYTES[name]
+            + b',"participants":' + orjson.dumps(sorted(activity["participants"]))
+            + b'}'
+            for name, activity in activities.items()
+        ) + b'}'
+        _ACTIVITIES_CACHE["body"] = body
+        _ACTIVITIES_CACHE["etag"] = (
+            f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+    etag = _ACTIVITIES_CACHE["etag"]
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=_ACTIVITIES_CACHE["body"],
+                    media_type="application/json",
+                    headers={"ETag": etag})
 
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: EmailStr) -> Response:
     """Sign up a student for an activity"""
-    # Validate email format
-    if not validate_email(email):
-        raise HTTPException(status_code=400, detail="Invalid email format")
-    
     # Validate activity exists
-    if activity_name not in activities:
+    activity_name = sys.intern(activity_name)
+    if activity_name not in _ACTIVITY_NAMES:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     activity = activities[activity_name]
 
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up")
+    async with _LOCKS[activity_name]:
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student already signed up")
 
-    # Validate activity has available spots
-    if len(activity["participants"]) >= activity["max_participants"]:
-        raise HTTPException(status_code=400, detail="Activity is full")
-    # Add student
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
+        # Validate activity has available spots
+        if len(activity["participants"]) >= activity["max_participants"]:
+            raise HTTPException(status_code=400, detail="Activity is full")
+        # Add student
+        activity["participants"].add(email)
+        _invalidate_activities_cache()
+    return _json_response({"message": f"Signed up {email} for {activity_name}"})
 
 
 # Unregister a participant from an activity
 @app.post("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email_request: EmailRequest):
+async def unregister_from_activity(activity_name: str, email_request: EmailRequest) -> Response:
     email = email_request.email
-    if activity_name not in activities:
+    activity_name = sys.intern(activity_name)
+    if activity_name not in _ACTIVITY_NAMES:
         raise HTTPException(status_code=404, detail="Activity not found")
     activity = activities[activity_name]
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student not registered for this activity")
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+    async with _LOCKS[activity_name]:
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail="Student not registered for this activity")
+        activity["participants"].discard(email)
+        _invalidate_activities_cache()
+    return _json_response({"message": f"Unregistered {email} from {activity_name}"})
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
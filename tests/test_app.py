@@ -167,6 +167,64 @@ def test_signup_with_plus_sign_properly_encoded():
     
     # Clean up - unregister the user
     client.post(f"/activities/{activity}/unregister", json={"email": email})
+def test_activities_conditional_get_returns_304():
+    response = client.get("/activities")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    # Quoted per RFC 7232
+    assert etag.startswith('"') and etag.endswith('"')
+
+    # Conditional GET with the current ETag short-circuits with 304
+    response = client.get("/activities", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_signup_changes_activities_etag():
+    test_email = "etagcheck@mergington.edu"
+    activity = "Chess Club"
+
+    # Ensure not already signed up
+    client.post(f"/activities/{activity}/unregister", json={"email": test_email})
+
+    old_etag = client.get("/activities").headers["etag"]
+
+    response = client.post(f"/activities/{activity}/signup?email={test_email}")
+    assert response.status_code == 200
+
+    # The old ETag no longer matches and the new body includes the participant
+    response = client.get("/activities", headers={"If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != old_etag
+    assert test_email in response.json()[activity]["participants"]
+
+    # Clean up
+    client.post(f"/activities/{activity}/unregister", json={"email": test_email})
+
+
+def test_root_serves_index_with_etag_and_gzip():
+    # Root serves the landing page directly (no redirect)
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert "content-encoding" not in response.headers
+
+    # Clients advertising gzip get the precompressed body
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+
+    # Conditional GET with the current ETag short-circuits with 304
+    etag = response.headers["etag"]
+    response = client.get("/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_static_assets_have_cache_control():
+    response = client.get("/static/index.html")
+    assert response.status_code == 200
+    assert "max-age" in response.headers.get("cache-control", "")
+
+
 def test_signup_when_activity_is_full():
     """Test that signup is rejected when activity has reached maximum participants"""
     # Use Chess Club which has max_participants: 12